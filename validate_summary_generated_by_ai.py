@@ -1,290 +1,615 @@
 import json
+import math
 import yaml
 import re
 import os
-from typing import Dict, List, Any, Tuple
+import sys
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+)
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Integers outside orjson's 64-bit range, which it parses as floats
+_WIDE_INT_RE = re.compile(r"-\d{19}|\d{20}")
+
+
+def _parse_json(json_data: str) -> Any:
+    """
+    Parse JSON with orjson when installed, falling back to json for input that
+    orjson rejects but json accepts (NaN, Infinity, lone surrogate escapes) or
+    that has integers orjson would turn into floats
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(json_data):
+        try:
+            return orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_data)
+
+
+def _compile_patterns(rules: Dict) -> Dict:
+    """
+    Pre-compile every regex 'pattern' in the rules tree so it is compiled once
+    per rules load instead of once per field per segment
+    """
+    stack = [rules]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            pattern = node.get("pattern")
+            if isinstance(pattern, str):
+                node["_pattern_compiled"] = re.compile(pattern)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return rules
+
+
+# Mapping between YAML field names and possible JSON field names, in lookup order
+_FIELD_NAME_MAPPING: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("segment_title", ("Segment Title", "segment_title")),
+    ("timestamps", ("Timestamps", "timestamps")),
+    ("editorial_subjects", ("Editorial subjects", "editorial_subjects")),
+    ("visual_subjects", ("Visual Subjects", "visual_subjects")),
+    ("names", ("Names", "names")),
+    ("location", ("Location", "location")),
+)
+
+_CANONICAL_FIELDS: Tuple[str, ...] = tuple(name for name, _ in _FIELD_NAME_MAPPING)
+
+# Interned names reported for segment-level confidence/score checks of a field
+_CONF_NAMES: Dict[str, str] = {
+    field_name: sys.intern(f"{field_name}_confidence")
+    for field_name in _CANONICAL_FIELDS
+}
+_SCORE_NAMES: Dict[str, str] = {
+    field_name: sys.intern(f"{field_name}_score") for field_name in _CANONICAL_FIELDS
+}
+
+# Flat lookup from any JSON alias to (YAML field name, alias preference rank)
+_ALIAS_TO_CANONICAL: Dict[str, Tuple[str, int]] = {
+    json_name: (field_name, rank)
+    for field_name, json_names in _FIELD_NAME_MAPPING
+    for rank, json_name in enumerate(json_names)
+}
+
+
+# Validation errors are collected as (code, field_name, *params) tuples and
+# only formatted into messages when the report is built
+_ErrorCode = Tuple[Any, ...]
+
+_ERROR_TEMPLATES = {
+    "required": "Required field '{0}' is missing",
+    "type_string": "Field '{0}' should be a string",
+    "type_number": "Field '{0}' should be a number",
+    "type_array": "Field '{0}' should be an array",
+    "type_object": "Field '{0}' should be an object",
+    "min_length": "Field '{0}' length should be at least {1}",
+    "pattern": "Field '{0}' does not match required pattern",
+    "enum": "Field '{0}' should be one of {1}",
+    "min_items": "Field '{0}' should have at least {1} items",
+    "min": "Field '{0}' should be at least {1}",
+    "max": "Field '{0}' should be at most {1}",
+    "threshold": "Field '{0}' should be at least {1}",
+    "confidence_threshold": "Field '{0}' should be at least '{1}'",
+}
+
+
+# Messages for errors without parameters, shared by every segment that fails
+# them; keyed by (field_name, code)
+_STATIC_ERRORS: Dict[Tuple[str, str], str] = {
+    (field_name, code): _ERROR_TEMPLATES[code].format(field_name)
+    for field_name in (
+        *_CANONICAL_FIELDS,
+        *_CONF_NAMES.values(),
+        *_SCORE_NAMES.values(),
+    )
+    for code in (
+        "required",
+        "type_string",
+        "type_number",
+        "type_array",
+        "type_object",
+        "pattern",
+    )
+}
+
+
+def _format_error(error: _ErrorCode) -> str:
+    """Format an error code tuple into its human-readable message"""
+    if len(error) == 2:
+        message = _STATIC_ERRORS.get((error[1], error[0]))
+        if message is not None:
+            return message
+    return _ERROR_TEMPLATES[error[0]].format(*error[1:])
+
+
+class FieldRule(NamedTuple):
+    """A field's YAML rules resolved into attributes, None where not set"""
+
+    required: bool
+    type: Optional[str]
+    min_length: Optional[int]
+    pattern: Optional[Pattern]
+    enum: Optional[List[Any]]
+    min_items: Optional[int]
+    min_val: Optional[float]
+    max_val: Optional[float]
+    threshold: Any
+    confidence: Optional["FieldRule"]
+    score: Optional["FieldRule"]
+
+
+def _field_rule(rule: Optional[Dict]) -> FieldRule:
+    """Convert a field's YAML rule dict, with compiled pattern, to a FieldRule"""
+    if rule is None:
+        rule = {}
+    confidence = rule.get("confidence")
+    score = rule.get("score")
+    return FieldRule(
+        required=rule.get("required", False),
+        type=rule.get("type"),
+        min_length=rule.get("min_length"),
+        pattern=rule.get("_pattern_compiled"),
+        enum=rule.get("enum"),
+        min_items=rule.get("min_items"),
+        min_val=rule.get("min"),
+        max_val=rule.get("max"),
+        threshold=rule.get("threshold"),
+        confidence=_field_rule(confidence) if confidence is not None else None,
+        score=_field_rule(score) if score is not None else None,
+    )
+
+
+# Exact types accepted as numbers; bool subclasses int but is not a number here
+_NUMERIC_TYPES = (int, float)
+
+# Confidence levels as numeric values for threshold comparison; read-only
+_CONF_LEVELS: Dict[str, int] = {"low": 1, "medium": 2, "high": 3}
+
+
+def _is_literal(obj: Any) -> bool:
+    """Whether repr(obj) is a Python literal that evaluates back to obj"""
+    if type(obj) is tuple:
+        return all(_is_literal(item) for item in obj)
+    if type(obj) is float:
+        return math.isfinite(obj)
+    return obj is None or type(obj) in (str, int, bool)
+
+
+# Type-specific check emitters; each returns the source lines that validate
+# 'value' against a FieldRule, appending error codes to 'errors'. const(obj)
+# returns a source expression for obj, a literal where possible.
+_Const = Callable[[Any], str]
+
+
+def _emit_string(rule: FieldRule, field_name: str, const: _Const) -> List[str]:
+    """Emit a string field's type, min_length, pattern and enum checks"""
+    checks = []
+    if rule.min_length is not None:
+        checks += [
+            f"if len(value) < {const(rule.min_length)}:",
+            f"    errors.append({const(('min_length', field_name, rule.min_length))})",
+        ]
+    if rule.pattern is not None:
+        checks += [
+            f"if not {const(rule.pattern)}.match(value):",
+            f"    errors.append({const(('pattern', field_name))})",
+        ]
+    if rule.enum is not None:
+        checks += [
+            f"if value not in {const(rule.enum)}:",
+            f"    errors.append({const(('enum', field_name, rule.enum))})",
+        ]
+    return _emit_type_check(
+        "not isinstance(value, str)", "type_string", field_name, checks, const
+    )
+
+
+def _emit_number(rule: FieldRule, field_name: str, const: _Const) -> List[str]:
+    """Emit a number field's type, min, max and threshold checks"""
+    checks = []
+    for bound, op, code in (
+        (rule.min_val, "<", "min"),
+        (rule.max_val, ">", "max"),
+        (rule.threshold, "<", "threshold"),
+    ):
+        if bound is not None:
+            checks += [
+                f"if value {op} {const(bound)}:",
+                f"    errors.append({const((code, field_name, bound))})",
+            ]
+    return _emit_type_check(
+        "type(value) not in _NUMERIC_TYPES", "type_number", field_name, checks, const
+    )
+
+
+def _emit_array(rule: FieldRule, field_name: str, const: _Const) -> List[str]:
+    """Emit an array field's type and min_items checks"""
+    checks = []
+    if rule.min_items is not None:
+        checks += [
+            f"if len(value) < {const(rule.min_items)}:",
+            f"    errors.append({const(('min_items', field_name, rule.min_items))})",
+        ]
+    return _emit_type_check(
+        "not isinstance(value, list)", "type_array", field_name, checks, const
+    )
+
+
+def _emit_object(rule: FieldRule, field_name: str, const: _Const) -> List[str]:
+    """Emit an object field's type check"""
+    return _emit_type_check(
+        "not isinstance(value, dict)", "type_object", field_name, [], const
+    )
+
+
+def _emit_type_check(
+    mismatch: str, code: str, field_name: str, checks: List[str], const: _Const
+) -> List[str]:
+    """Emit a type check that runs checks only when the type matches"""
+    lines = [f"if {mismatch}:", f"    errors.append({const((code, field_name))})"]
+    if checks:
+        lines.append("else:")
+        lines += _indent(checks)
+    return lines
+
+
+def _indent(lines: List[str]) -> List[str]:
+    """Indent source lines by one level"""
+    return ["    " + line for line in lines]
+
+
+# Type-specific check emitters keyed by the rule's 'type'
+_TYPE_EMITTERS = {
+    "string": _emit_string,
+    "number": _emit_number,
+    "array": _emit_array,
+    "object": _emit_object,
+}
+
+
+# JSON files at or above this size are streamed by the CLI when ijson is installed
+_STREAM_MIN_BYTES = 100 * 1024 * 1024
+
+# How much of the validation report to build
+ReportDetail = Literal["none", "summary", "full"]
+
+
+# Parsed rules keyed by (path, mtime_ns, size); rules are read-only once loaded
+_RULES_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_RULES_CACHE_MAX_SIZE = 100
+
+
+def _load_rules(yaml_rules_path: str) -> Dict:
+    """
+    Load and pre-compile YAML rules, reusing the cached copy while the file
+    is unchanged
+    """
+    stat = os.stat(yaml_rules_path)
+    key = (os.path.abspath(yaml_rules_path), stat.st_mtime_ns, stat.st_size)
+
+    rules = _RULES_CACHE.get(key)
+    if rules is not None:
+        _RULES_CACHE.move_to_end(key)
+        return rules
+
+    with open(yaml_rules_path, "r") as file:
+        rules = yaml.load(file, Loader=_YamlLoader)
+    _compile_patterns(rules)
+
+    _RULES_CACHE[key] = rules
+    if len(_RULES_CACHE) > _RULES_CACHE_MAX_SIZE:
+        _RULES_CACHE.popitem(last=False)
+    return rules
+
+
+def _emit_field_checks(
+    rule: FieldRule, field_name: str, const: _Const, *, is_confidence: bool = False
+) -> List[str]:
+    """
+    Emit the checks of 'value' against a field's structure rules; is_confidence
+    also emits the low/medium/high confidence threshold check
+    """
+    # Check if field is required but missing; otherwise skip a missing field
+    lines = ["if value is None:"]
+    if rule.required:
+        lines.append(f"    errors.append({const(('required', field_name))})")
+    else:
+        lines.append("    pass")
+
+    # Validate field type and type-specific rules
+    checks = []
+    emitter = _TYPE_EMITTERS.get(rule.type)
+    if emitter is not None:
+        checks += emitter(rule, field_name, const)
+
+    # Validate confidence threshold
+    if is_confidence and rule.threshold is not None:
+        required_level = _CONF_LEVELS.get(rule.threshold, 0)
+        if required_level > 0:
+            checks += [
+                f"if _CONF_LEVELS.get(value, 0) < {required_level}:",
+                "    errors.append("
+                f"{const(('confidence_threshold', field_name, rule.threshold))})",
+            ]
+
+    if checks:
+        lines.append("else:")
+        lines += _indent(checks)
+    return lines
+
+
+def _build_field_plan(
+    field_rules: Dict,
+) -> List[Tuple[str, FieldRule, Optional[FieldRule], str, Optional[FieldRule], str]]:
+    """
+    Resolve each field's rules, including its confidence/score rules, once
+    instead of once per field per segment
+    """
+    field_plan = []
+    for field_name in _CANONICAL_FIELDS:
+        field_rule = _field_rule(field_rules.get(field_name, {}))
+        field_plan.append(
+            (
+                field_name,
+                field_rule,
+                field_rule.confidence,
+                _CONF_NAMES[field_name],
+                field_rule.score,
+                _SCORE_NAMES[field_name],
+            )
+        )
+    return field_plan
+
+
+def _compile_segment_validator(
+    field_plan: List,
+) -> Callable[[int, Dict, bool], Tuple[bool, Optional[Dict]]]:
+    """
+    Generate and compile a segment validator specialized to field_plan, with
+    every rule value baked into the code instead of looked up per segment
+
+    The returned function takes (index, segment, full_detail) and returns the
+    segment's validity and, when full_detail is set, its validation report.
+    """
+    namespace = {
+        "_ALIAS_TO_CANONICAL": _ALIAS_TO_CANONICAL,
+        "_CONF_LEVELS": _CONF_LEVELS,
+        "_format_error": _format_error,
+        "_NUMERIC_TYPES": _NUMERIC_TYPES,
+    }
+
+    def const(obj: Any) -> str:
+        if _is_literal(obj):
+            return repr(obj)
+        name = f"_const_{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    body = [
+        # Bucket the segment's keys by YAML field name in a single pass,
+        # keeping the preferred alias when more than one is present
+        "present = {}",
+        "for json_name, value in segment.items():",
+        "    alias = _ALIAS_TO_CANONICAL.get(json_name)",
+        "    if alias is None:",
+        "        continue",
+        "    canonical, rank = alias",
+        "    found = present.get(canonical)",
+        "    if found is None or rank < found[0]:",
+        "        present[canonical] = (rank, json_name, value)",
+        # Segment-level confidence/score apply to every field that has rules
+        'confidence_value = segment.get("confidence")',
+        'score_value = segment.get("score")',
+        "segment_valid = True",
+        "if full_detail:",
+        "    field_validations = {}",
+    ]
+
+    for (
+        field_name,
+        field_rule,
+        confidence_rule,
+        confidence_name,
+        score_rule,
+        score_name,
+    ) in field_plan:
+        # Find the field in JSON and validate its structure
+        body += [
+            f"found = present.get({const(field_name)})",
+            "if found is not None:",
+            "    _, json_field_name, value = found",
+            "else:",
+            "    json_field_name = None",
+            "    value = None",
+            "errors = []",
+        ]
+        body += _emit_field_checks(field_rule, field_name, const)
+
+        # If segment-level confidence/score is present, use them for validation
+        if confidence_rule is not None:
+            body += ["if confidence_value is not None:", "    value = confidence_value"]
+            body += _indent(
+                _emit_field_checks(
+                    confidence_rule, confidence_name, const, is_confidence=True
+                )
+            )
+        if score_rule is not None:
+            body += ["if score_value is not None:", "    value = score_value"]
+            body += _indent(_emit_field_checks(score_rule, score_name, const))
+
+        # Add field validation to report and update segment validation status
+        body += [
+            "if errors:",
+            "    segment_valid = False",
+            "if full_detail:",
+            f"    field_validations[{const(field_name)}] = {{",
+            '        "valid": not errors,',
+            '        "json_field_name": json_field_name,',
+            '        "errors": [_format_error(error) for error in errors],',
+            "    }",
+        ]
+
+    body += [
+        "if not full_detail:",
+        "    return segment_valid, None",
+        # The title comes from the preferred segment_title alias already
+        # bucketed above, falling back to "Unknown" when no alias is present
+        'found = present.get("segment_title")',
+        "return segment_valid, {",
+        '    "segment_index": index,',
+        '    "segment_title": found[2] if found is not None else "Unknown",',
+        '    "valid": segment_valid,',
+        '    "field_validations": field_validations,',
+        "}",
+    ]
+
+    source = "\n".join(
+        ["def validate_segment(index, segment, full_detail):", *_indent(body)]
+    )
+    exec(compile(source, "<segment validator>", "exec"), namespace)
+    return namespace["validate_segment"]
+
+
+def _segment_validator(
+    segments_rules: Dict,
+) -> Callable[[int, Dict, bool], Tuple[bool, Optional[Dict]]]:
+    """
+    Return the compiled segment validator for the segments rules, building it
+    once per loaded rules and storing it alongside
+    """
+    validate_segment = segments_rules.get("_segment_validator")
+    if validate_segment is None:
+        field_plan = _build_field_plan(segments_rules["item_schema"]["fields"])
+        validate_segment = _compile_segment_validator(field_plan)
+        segments_rules["_segment_validator"] = validate_segment
+    return validate_segment
+
+
+def _error_report(error: str, total_segments: int = 0) -> Dict:
+    """Build the report returned when validation cannot run over the segments"""
+    return {
+        "valid": False,
+        "error": error,
+        "segments_validation": [],
+        "summary": {
+            "total_segments": total_segments,
+            "valid_segments": 0,
+            "invalid_segments": total_segments,
+            "overall_status": "FAIL",
+        },
+    }
 
 
-def validate_video_summary(json_data: str, yaml_rules_path: str) -> Dict:
+def validate_video_summary(
+    json_data: str, yaml_rules_path: str, detail: ReportDetail = "full"
+) -> Dict:
     """
     Validate video summary metadata JSON against YAML rules loaded from a file
+
+    detail controls how much of the report is built:
+    - "full": per-segment and per-field results plus the summary
+    - "summary": only the summary, segments_validation is left empty
+    - "none": only the overall "valid" flag, stopping at the first invalid segment
     """
     # Parse JSON data
     try:
-        data = json.loads(json_data)
+        data = _parse_json(json_data)
     except json.JSONDecodeError:
-        return {
-            "valid": False,
-            "error": "Invalid JSON format",
-            "segments_validation": [],
-            "summary": {
-                "total_segments": 0,
-                "valid_segments": 0,
-                "invalid_segments": 0,
-                "overall_status": "FAIL",
-            },
-        }
+        return _error_report("Invalid JSON format")
 
     # Load YAML rules from file
     try:
         if not os.path.exists(yaml_rules_path):
-            return {
-                "valid": False,
-                "error": f"YAML rules file not found: {yaml_rules_path}",
-                "segments_validation": [],
-                "summary": {
-                    "total_segments": 0,
-                    "valid_segments": 0,
-                    "invalid_segments": 0,
-                    "overall_status": "FAIL",
-                },
-            }
-
-        with open(yaml_rules_path, "r") as file:
-            yaml_content = file.read()
-            rules = yaml.safe_load(yaml_content)
-    except Exception as e:
-        return {
-            "valid": False,
-            "error": f"Error loading YAML rules: {str(e)}",
-            "segments_validation": [],
-            "summary": {
-                "total_segments": 0,
-                "valid_segments": 0,
-                "invalid_segments": 0,
-                "overall_status": "FAIL",
-            },
-        }
-
-    # Helper functions for validation
-    def validate_field_structure(
-        field_value: Any, field_rules: Dict, field_name: str
-    ) -> Tuple[bool, List[str]]:
-        """Validate a field against its structure rules"""
-        errors = []
-
-        # Check if field is required but missing
-        if field_rules.get("required", False) and field_value is None:
-            errors.append(f"Required field '{field_name}' is missing")
-            return False, errors
-
-        # If field is not required and is None, skip further validation
-        if not field_rules.get("required", False) and field_value is None:
-            return True, errors
-
-        # Validate field type
-        field_type = field_rules.get("type")
-        if field_type == "string" and not isinstance(field_value, str):
-            errors.append(f"Field '{field_name}' should be a string")
-        elif field_type == "number" and not isinstance(field_value, (int, float)):
-            errors.append(f"Field '{field_name}' should be a number")
-        elif field_type == "array" and not isinstance(field_value, list):
-            errors.append(f"Field '{field_name}' should be an array")
-        elif field_type == "object" and not isinstance(field_value, dict):
-            errors.append(f"Field '{field_name}' should be an object")
-
-        # Validate string fields
-        if field_type == "string" and isinstance(field_value, str):
-            # Validate min_length
-            min_length = field_rules.get("min_length")
-            if min_length is not None and len(field_value) < min_length:
-                errors.append(
-                    f"Field '{field_name}' length should be at least {min_length}"
-                )
+            return _error_report(f"YAML rules file not found: {yaml_rules_path}")
 
-            # Validate pattern
-            pattern = field_rules.get("pattern")
-            if pattern is not None and not re.match(pattern, field_value):
-                errors.append(f"Field '{field_name}' does not match required pattern")
-
-            # Validate enum
-            enum_values = field_rules.get("enum")
-            if enum_values is not None and field_value not in enum_values:
-                errors.append(f"Field '{field_name}' should be one of {enum_values}")
-
-        # Validate array fields
-        if field_type == "array" and isinstance(field_value, list):
-            # Validate min_items
-            min_items = field_rules.get("min_items")
-            if min_items is not None and len(field_value) < min_items:
-                errors.append(
-                    f"Field '{field_name}' should have at least {min_items} items"
-                )
-
-        # Validate number fields
-        if field_type == "number" and isinstance(field_value, (int, float)):
-            # Validate min
-            min_val = field_rules.get("min")
-            if min_val is not None and field_value < min_val:
-                errors.append(f"Field '{field_name}' should be at least {min_val}")
-
-            # Validate max
-            max_val = field_rules.get("max")
-            if max_val is not None and field_value > max_val:
-                errors.append(f"Field '{field_name}' should be at most {max_val}")
-
-            # Validate threshold
-            threshold = field_rules.get("threshold")
-            if threshold is not None and field_value < threshold:
-                errors.append(f"Field '{field_name}' should be at least {threshold}")
-
-        # Validate confidence threshold
-        if field_name.endswith("confidence"):
-            threshold = field_rules.get("threshold")
-            if threshold is not None:
-                # Convert confidence levels to numeric values for comparison
-                confidence_levels = {"low": 1, "medium": 2, "high": 3}
-                required_level = confidence_levels.get(threshold, 0)
-                actual_level = confidence_levels.get(field_value, 0)
-
-                if actual_level < required_level:
-                    errors.append(
-                        f"Field '{field_name}' should be at least '{threshold}'"
-                    )
-
-        return len(errors) == 0, errors
+        rules = _load_rules(yaml_rules_path)
+    except Exception as e:
+        return _error_report(f"Error loading YAML rules: {str(e)}")
 
     # Validate segments field
     segments_rules = rules["validation"]["structure"]["fields"]["segments"]
 
     if "segments" not in data:
-        return {
-            "valid": False,
-            "error": "Required field 'segments' is missing",
-            "segments_validation": [],
-            "summary": {
-                "total_segments": 0,
-                "valid_segments": 0,
-                "invalid_segments": 0,
-                "overall_status": "FAIL",
-            },
-        }
+        return _error_report("Required field 'segments' is missing")
 
     if not isinstance(data["segments"], list):
-        return {
-            "valid": False,
-            "error": "Field 'segments' should be an array",
-            "segments_validation": [],
-            "summary": {
-                "total_segments": 0,
-                "valid_segments": 0,
-                "invalid_segments": 0,
-                "overall_status": "FAIL",
-            },
-        }
+        return _error_report("Field 'segments' should be an array")
 
     # Check min_items constraint for segments
     min_segments = segments_rules.get("min_items", 0)
     if len(data["segments"]) < min_segments:
-        return {
-            "valid": False,
-            "error": f"There should be at least {min_segments} segments",
-            "segments_validation": [],
-            "summary": {
-                "total_segments": len(data["segments"]),
-                "valid_segments": 0,
-                "invalid_segments": len(data["segments"]),
-                "overall_status": "FAIL",
-            },
-        }
+        return _error_report(
+            f"There should be at least {min_segments} segments", len(data["segments"])
+        )
+
+    # Get the segment validator compiled for these rules
+    try:
+        validate_segment = _segment_validator(segments_rules)
+    except KeyError as e:
+        return _error_report(f"Error loading YAML rules: {str(e)}")
 
     # Validate each segment
     segments_validation = []
     valid_segments = 0
+    all_valid = True
+    full_detail = detail == "full"
 
     for i, segment in enumerate(data["segments"]):
-        segment_validation = {
-            "segment_index": i,
-            "segment_title": segment.get(
-                "Segment Title", segment.get("segment_title", "Unknown")
-            ),
-            "valid": True,
-            "field_validations": {},
-        }
-
-        # Get item schema for segment
-        item_schema = segments_rules["item_schema"]
-        field_rules = item_schema["fields"]
-
-        # Define mapping between YAML field names and possible JSON field names
-        field_name_mapping = {
-            "segment_title": ["Segment Title", "segment_title"],
-            "timestamps": ["Timestamps", "timestamps"],
-            "editorial_subjects": ["Editorial subjects", "editorial_subjects"],
-            "visual_subjects": ["Visual Subjects", "visual_subjects"],
-            "names": ["Names", "names"],
-            "location": ["Location", "location"],
-        }
-
-        # Validate each field in the segment
-        for field_name, possible_json_names in field_name_mapping.items():
-            # Find the field in JSON
-            field_value = None
-            json_field_name = None
-            for json_name in possible_json_names:
-                if json_name in segment:
-                    field_value = segment[json_name]
-                    json_field_name = json_name
-                    break
-
-            # Get validation rules for this field
-            field_rule = field_rules.get(field_name, {})
-
-            # Validate field structure
-            valid, errors = validate_field_structure(
-                field_value, field_rule, field_name
-            )
-
-            # Check for confidence and score
-            confidence_value = segment.get("confidence")
-            score_value = segment.get("score")
-
-            # If segment-level confidence/score is present, use them for validation
-            if confidence_value is not None and "confidence" in field_rule:
-                confidence_rule = field_rule["confidence"]
-                conf_valid, conf_errors = validate_field_structure(
-                    confidence_value, confidence_rule, f"{field_name}_confidence"
-                )
-                valid = valid and conf_valid
-                errors.extend(conf_errors)
-
-            if score_value is not None and "score" in field_rule:
-                score_rule = field_rule["score"]
-                score_valid, score_errors = validate_field_structure(
-                    score_value, score_rule, f"{field_name}_score"
-                )
-                valid = valid and score_valid
-                errors.extend(score_errors)
-
-            # Add field validation to report
-            segment_validation["field_validations"][field_name] = {
-                "valid": valid,
-                "json_field_name": json_field_name,
-                "errors": errors,
-            }
-
-            # Update segment validation status
-            if not valid:
-                segment_validation["valid"] = False
+        segment_valid, segment_validation = validate_segment(i, segment, full_detail)
 
         # Add segment validation to report
-        segments_validation.append(segment_validation)
+        if full_detail:
+            segments_validation.append(segment_validation)
 
         # Count valid segments
-        if segment_validation["valid"]:
+        if segment_valid:
             valid_segments += 1
+        else:
+            all_valid = False
+            if detail == "none":
+                return {"valid": False}
+
+    if detail == "none":
+        return {"valid": all_valid}
 
     # Create summary
     summary = {
         "total_segments": len(data["segments"]),
         "valid_segments": valid_segments,
         "invalid_segments": len(data["segments"]) - valid_segments,
-        "overall_status": "PASS" if valid_segments == len(data["segments"]) else "FAIL",
+        "overall_status": "PASS" if all_valid else "FAIL",
     }
 
     # Create final report
     report = {
-        "valid": valid_segments == len(data["segments"]),
+        "valid": all_valid,
         "segments_validation": segments_validation,
         "summary": summary,
     }
@@ -292,18 +617,175 @@ def validate_video_summary(json_data: str, yaml_rules_path: str) -> Dict:
     return report
 
 
+def stream_validate_video_summary(
+    json_path: str, yaml_rules_path: str, out: TextIO, detail: ReportDetail = "full"
+) -> bool:
+    """
+    Validate a video summary JSON file one segment at a time with ijson, writing
+    the report to out as segments are validated so memory use stays bounded by
+    a single segment rather than the whole payload
+
+    The report matches validate_video_summary, except that with detail "full"
+    the "valid" flag is written last, once every segment has been seen. A JSON
+    syntax error found after part of the report has been written is raised
+    rather than reported. Returns whether the metadata is valid.
+    """
+
+    def rules_error(error: str) -> bool:
+        # validate_video_summary parses the JSON first, so invalid JSON wins
+        try:
+            with open(json_path, "rb") as file:
+                for _ in ijson.parse(file):
+                    pass
+        except ijson.JSONError:
+            error = "Invalid JSON format"
+        json.dump(_error_report(error), out, indent=2)
+        return False
+
+    # Load YAML rules from file
+    try:
+        if not os.path.exists(yaml_rules_path):
+            return rules_error(f"YAML rules file not found: {yaml_rules_path}")
+
+        rules = _load_rules(yaml_rules_path)
+    except Exception as e:
+        return rules_error(f"Error loading YAML rules: {str(e)}")
+
+    segments_rules = rules["validation"]["structure"]["fields"]["segments"]
+    min_segments = segments_rules.get("min_items", 0)
+    try:
+        validate_segment = _segment_validator(segments_rules)
+    except KeyError as e:
+        return rules_error(f"Error loading YAML rules: {str(e)}")
+    full_detail = detail == "full"
+
+    # First event seen at the top-level "segments" key, if any
+    segments_event = []
+
+    def watch_segments(events):
+        for prefix, event, value in events:
+            if prefix == "segments" and not segments_event:
+                segments_event.append(event)
+            yield prefix, event, value
+
+    total_segments = 0
+    valid_segments = 0
+    all_valid = True
+    pending = []
+    header_written = False
+
+    with open(json_path, "rb") as file:
+        try:
+            events = watch_segments(ijson.parse(file, use_float=True))
+            for segment in ijson.items(events, "segments.item"):
+                # "segments.item" also matches the "item" key of a segments
+                # object, which is reported as not an array once the file
+                # has been read
+                if segments_event[0] != "start_array":
+                    continue
+
+                # With detail "none" the outcome is known after the first
+                # invalid segment, but the rest of the file is still read so
+                # invalid JSON and min_items are reported as in memory
+                if detail == "none" and not all_valid:
+                    total_segments += 1
+                    continue
+
+                segment_valid, segment_validation = validate_segment(
+                    total_segments, segment, full_detail
+                )
+                total_segments += 1
+
+                # Count valid segments
+                if segment_valid:
+                    valid_segments += 1
+                else:
+                    all_valid = False
+
+                # Write segment validation to report, holding back the first
+                # segments until the min_items constraint is known to be met
+                if full_detail:
+                    pending.append(segment_validation)
+                    if total_segments >= min_segments:
+                        if not header_written:
+                            out.write('{\n  "segments_validation": [')
+                        for pending_validation in pending:
+                            out.write(",\n    " if header_written else "\n    ")
+                            out.write(
+                                json.dumps(pending_validation, indent=2).replace(
+                                    "\n", "\n    "
+                                )
+                            )
+                            header_written = True
+                        pending.clear()
+        except ijson.JSONError:
+            # Report invalid JSON as usual unless part of the report is out
+            if header_written:
+                raise
+            json.dump(_error_report("Invalid JSON format"), out, indent=2)
+            return False
+
+    if not segments_event:
+        report = _error_report("Required field 'segments' is missing")
+        json.dump(report, out, indent=2)
+        return False
+
+    if segments_event[0] != "start_array":
+        json.dump(_error_report("Field 'segments' should be an array"), out, indent=2)
+        return False
+
+    # Check min_items constraint for segments
+    if total_segments < min_segments:
+        report = _error_report(
+            f"There should be at least {min_segments} segments", total_segments
+        )
+        json.dump(report, out, indent=2)
+        return False
+
+    if detail == "none":
+        json.dump({"valid": all_valid}, out, indent=2)
+        return all_valid
+
+    # Create summary
+    summary = {
+        "total_segments": total_segments,
+        "valid_segments": valid_segments,
+        "invalid_segments": total_segments - valid_segments,
+        "overall_status": "PASS" if all_valid else "FAIL",
+    }
+
+    if not full_detail:
+        report = {
+            "valid": all_valid,
+            "segments_validation": [],
+            "summary": summary,
+        }
+        json.dump(report, out, indent=2)
+        return all_valid
+
+    if header_written:
+        out.write("\n  ],\n")
+    else:
+        out.write('{\n  "segments_validation": [],\n')
+    out.write('  "summary": ' + json.dumps(summary, indent=2).replace("\n", "\n  "))
+    out.write(',\n  "valid": ' + json.dumps(all_valid) + "\n}")
+    return all_valid
+
+
 # Default YAML rules path
 DEFAULT_RULES_PATH = "summary_validation_rules.yaml"
 
 
 def validate_metadata(
-    json_data: str, yaml_rules_path: str = DEFAULT_RULES_PATH
+    json_data: str,
+    yaml_rules_path: str = DEFAULT_RULES_PATH,
+    detail: ReportDetail = "full",
 ) -> Dict:
     """
     Wrapper function to validate video summary metadata JSON
 
     """
-    return validate_video_summary(json_data, yaml_rules_path)
+    return validate_video_summary(json_data, yaml_rules_path, detail)
 
 
 if __name__ == "__main__":
@@ -325,9 +807,43 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output", "-o", help="Path to save the validation report (optional)"
     )
+    parser.add_argument(
+        "--detail",
+        "-d",
+        choices=["none", "summary", "full"],
+        default="full",
+        help="Level of detail in the validation report (default: full)",
+    )
 
     args = parser.parse_args()
 
+    # Stream large JSON files segment by segment when ijson is available
+    try:
+        stream = (
+            ijson is not None and os.path.getsize(args.json_file) >= _STREAM_MIN_BYTES
+        )
+    except OSError:
+        stream = False
+
+    if stream:
+        try:
+            if args.output:
+                with open(args.output, "w") as file:
+                    stream_validate_video_summary(
+                        args.json_file, args.rules, file, args.detail
+                    )
+                print(f"Validation report saved to {args.output}")
+            else:
+                stream_validate_video_summary(
+                    args.json_file, args.rules, sys.stdout, args.detail
+                )
+                print()
+        except Exception as e:
+            # Part of the report may already be written; keep the error apart
+            print(f"Error validating JSON file: {str(e)}", file=sys.stderr)
+            exit(1)
+        exit(0)
+
     # Read JSON data from file
     try:
         with open(args.json_file, "r") as file:
@@ -337,7 +853,7 @@ if __name__ == "__main__":
         exit(1)
 
     # Validate the data
-    validation_result = validate_metadata(json_data, args.rules)
+    validation_result = validate_metadata(json_data, args.rules, args.detail)
 
     # Output the results
     if args.output: